@@ -1,4 +1,6 @@
+import asyncio
 import logging
+from functools import lru_cache
 from homeassistant.components.sensor import SensorEntity
 from .const import DOMAIN
 
@@ -19,41 +21,362 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     ws_manager = hass.data[DOMAIN]["ws_manager"]
     entities = []
 
+    # Fetch every sensor source concurrently, a failing source must not block the others
+    sources = ("domus", "powerlines", "partitions", "zones", "systems")
+    results = await asyncio.gather(
+        ws_manager.getDom(),
+        ws_manager.getSensor("POWER_LINES"),
+        ws_manager.getSensor("PARTITIONS"),
+        ws_manager.getSensor("ZONES"),
+        ws_manager.getSystem(),
+        return_exceptions=True,
+    )
+    fetched = []
+    for source, result in zip(sources, results):
+        if isinstance(result, BaseException):
+            _LOGGER.error("Error retrieving %s data: %s", source, result)
+            result = []
+        # Only build the (possibly large) payload dump when debug logging is enabled
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Received %s data (%d items): %s", source, len(result), result)
+        fetched.append(result)
+    domus, powerlines, partitions, zones, systems = fetched
+
     # DOMUS sensors
-    domus = await ws_manager.getDom()
-    _LOGGER.debug("Received domus data: %s", domus)
     for sensor in domus:
         sensor_type = "door" if sensor.get("CAT", "").upper() == "DOOR" else "domus"
         entities.append(KseniaSensorEntity(ws_manager, sensor, sensor_type))
 
     # POWERLINES sensors
-    powerlines = await ws_manager.getSensor("POWER_LINES")
-    _LOGGER.debug("Received powerlines data: %s", powerlines)
     for sensor in powerlines:
         entities.append(KseniaSensorEntity(ws_manager, sensor, "powerlines"))
 
     # PARTITIONS sensors
-    partitions = await ws_manager.getSensor("PARTITIONS")
-    _LOGGER.debug("Received partitions data: %s", partitions)
     for sensor in partitions:
         entities.append(KseniaSensorEntity(ws_manager, sensor, "partitions"))
 
     # ZONES sensors
-    zones = await ws_manager.getSensor("ZONES")
-    _LOGGER.debug("Received zones data: %s", zones)
     for sensor in zones:
         entities.append(KseniaSensorEntity(ws_manager, sensor, "zones"))
 
     # SYSTEM sensors for system status
-    systems = await ws_manager.getSystem()
-    _LOGGER.debug("Received systems data: %s", systems)
     for sensor in systems:
         entities.append(KseniaSensorEntity(ws_manager, sensor, "system"))
 
-    async_add_entities(entities, update_before_add=True)
+    # Entities are primed from the data fetched above, no need to refresh them before adding
+    async_add_entities(entities, update_before_add=False)
+
+SYSTEM_STATE_MAP = {
+    "T": "Fully Armed",
+    "T_IN": "Fully Armed with Entry Delay Active",
+    "T_OUT": "Fully Armed with Exit Delay Active",
+    "P": "Partially Armed",
+    "P_IN": "Partially Armed with Entry Delay Active",
+    "P_OUT": "Partially Armed with Exit Delay Active",
+    "D": "Disarmed"
+}
+
+PARTITION_ARM_MAP = {
+    "D":  "Disarmed",
+    "DA": "Delayed Arming",
+    "IA": "Immediate Arming",
+    "IT": "Input time",
+    "OT": "Output time",
+}
+PARTITION_AST_MAP = {
+    "OK": "No ongoing alarm",
+    "AL": "Ongoing alarm",
+    "AM": "Alarm memory",
+}
+PARTITION_TST_MAP = {
+    "OK":  "No ongoing tampering",
+    "TAM": "Ongoing tampering",
+    "TM":  "Tampering memory",
+}
+
+CONTACT_STATE_MAP = {"R": "Closed", "A": "Open"}
+MOVEMENT_STATE_MAP = {"R": "Off", "A": "On"}
+CMD_STATE_MAP = {"R": "Released", "A": "Armed", "D": "Disarmed"}
+SEISM_STATE_MAP = {"R": "Rest", "A": "Seismic Activity", "N": "Normal"}
+
+# Zone categories handled as dedicated sensor types
+ZONE_CATEGORIES = {"door", "window", "cmd", "imov", "emov", "pmc", "seism"}
+
+# Prefix used for the name of the zone categories (command zones use their label as is)
+ZONE_NAME_PREFIX = {
+    "door": "Door Sensor",
+    "window": "Window Sensor",
+    "imov": "Internal Movement Sensor",
+    "emov": "External Movement Sensor",
+    "pmc": "Perimetral Magnetic Contact Sensor",
+    "seism": "Seismic Sensor",
+}
+
+
+"""
+Converts a raw numeric reading (e.g. "+21.5", "1234", "NA") to a float.
+
+Readings of stable sensors repeat very often, so string conversions are cached.
+
+:return: The converted value, None if the reading is empty or not numeric
+"""
+def _parse_signed_float(value):
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        return _parse_float_string(value)
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=512)
+def _parse_float_string(value):
+    try:
+        return float(value.lstrip("+"))
+    except ValueError:
+        return None
+
+
+"""
+Maps the raw STA code of a zone to a readable state.
+
+Unknown codes are returned as they are, a missing code becomes "unknown".
+"""
+def _map_zone_state(sensor_data, state_mapping):
+    raw_state = sensor_data.get("STA", "unknown")
+    return state_mapping.get(raw_state, raw_state)
+
+
+# Raw zone fields exposed as attributes; seismic zones only expose a subset of them
+ZONE_ATTRIBUTE_FIELDS = ("DES", "PRT", "CMD", "BYP EN", "AN", "STA", "BYP", "T", "A", "FM", "OHM", "VAS", "LBL")
+SEISM_ATTRIBUTE_FIELDS = ("DES", "PRT", "STA", "BYP", "T", "A", "FM")
+
+
+"""
+Builds the attributes shared by the zone sensors.
+
+:param sensor_data: Dictionary with the zone data
+:param state: Readable state to expose as "State" attribute
+:param command_mapping: Mapping for the CMD code, None if the zone has no command attribute
+:param fields: Raw zone fields to expose
+:param state_required: If False, "State" is only exposed when the zone reports a STA code
+"""
+def _zone_attributes(sensor_data, state, command_mapping=None, fields=ZONE_ATTRIBUTE_FIELDS, state_required=True):
+    def has(key):
+        return key in fields and key in sensor_data
+
+    attributes = {}
+    if has("DES"):
+        attributes["Description"] = sensor_data["DES"]
+    if has("PRT"):
+        attributes["Partition"] = sensor_data["PRT"]
+    if command_mapping is not None and has("CMD"):
+        attributes["Command"] = command_mapping.get(sensor_data["CMD"], sensor_data["CMD"])
+    if has("BYP EN"):
+        attributes["Bypass Enabled"] = "Yes" if sensor_data["BYP EN"] == "T" else "No"
+    if has("AN"):
+        attributes["Signal Type"] = "Analog" if sensor_data["AN"] == "T" else "Digital"
+    if state_required or has("STA"):
+        attributes["State"] = state
+    if has("BYP"):
+        attributes["Bypass"] = "Active" if sensor_data["BYP"].upper() not in ["NO", "N"] else "Inactive"
+    if has("T"):
+        attributes["Tamper"] = "Yes" if sensor_data["T"] == "T" else "No"
+    if has("A"):
+        attributes["Alarm"] = "On" if sensor_data["A"] == "T" else "Off"
+    if has("FM"):
+        attributes["Fault Memory"] = "Yes" if sensor_data["FM"] == "T" else "No"
+    if has("OHM"):
+        attributes["Resistance"] = sensor_data["OHM"] if sensor_data["OHM"] != "NA" else "N/A"
+    if has("VAS"):
+        attributes["Voltage Alarm Sensor"] = "Active" if sensor_data["VAS"] == "T" else "Inactive"
+    if has("LBL") and sensor_data["LBL"]:
+        attributes["Label"] = sensor_data["LBL"]
+    return attributes
+
+
+"""
+Parsers converting the raw data of a sensor into its (state, attributes) pair.
+
+They are pure functions shared by the initial setup, the polling and the
+real-time updates, selected through `_PARSERS` by sensor type.
+"""
+def _parse_contact(sensor_data):
+    state = _map_zone_state(sensor_data, CONTACT_STATE_MAP)
+    return state, _zone_attributes(sensor_data, state, {"F": "Fixed"})
+
+
+def _parse_pmc(sensor_data):
+    state = _map_zone_state(sensor_data, CONTACT_STATE_MAP)
+    return state, _zone_attributes(sensor_data, state, {"F": "Fixed"}, state_required=False)
+
+
+def _parse_cmd(sensor_data):
+    state = _map_zone_state(sensor_data, CMD_STATE_MAP)
+    attributes = _zone_attributes(sensor_data, state, {"T": "Trigger"}, state_required=False)
+    return sensor_data.get("STA", "unknown"), attributes
+
+
+def _parse_movement(sensor_data):
+    state = _map_zone_state(sensor_data, MOVEMENT_STATE_MAP)
+    return state, _zone_attributes(sensor_data, state, state_required=False)
+
+
+def _parse_seism(sensor_data):
+    state = _map_zone_state(sensor_data, SEISM_STATE_MAP)
+    return state, _zone_attributes(sensor_data, state, fields=SEISM_ATTRIBUTE_FIELDS)
+
+
+def _parse_system(sensor_data):
+    arm_data = sensor_data.get("ARM", {})
+    if not isinstance(arm_data, dict):
+        arm_data = {}
+    state_code = arm_data.get("S")
+    if state_code is None:
+        _LOGGER.error(
+            "Ksenia system sensor %s: 'S' key missing in ARM; ARM data received: %r",
+            sensor_data.get("ID"), arm_data
+        )
+        state_code = ""
+    if state_code not in SYSTEM_STATE_MAP:
+        _LOGGER.error(
+            "Ksenia system sensor %s: unwanted ARM code %r → cannot map!",
+            sensor_data.get("ID"), state_code
+        )
+    return SYSTEM_STATE_MAP.get(state_code, state_code), {}
+
+
+def _parse_powerlines(sensor_data):
+    pcons_val = _parse_signed_float(sensor_data.get("PCONS"))
+    pprod_val = _parse_signed_float(sensor_data.get("PPROD"))
+    # Use PCONS if it exists, otherwise use STATUS
+    consumo_kwh = round(pcons_val / 1000, 3) if pcons_val is not None else None
+    state = pcons_val if pcons_val is not None else sensor_data.get("STATUS", "Unknown")
+    return state, {
+        "Consumption": consumo_kwh,
+        "Production": pprod_val,
+        "Status": sensor_data.get("STATUS", "Unknown")
+    }
+
+
+def _parse_domus(sensor_data):
+    domus_data = sensor_data.get("DOMUS", {})
+    if not isinstance(domus_data, dict):
+        domus_data = {}
+    temperature = _parse_signed_float(domus_data.get("TEM"))
+    humidity = _parse_signed_float(domus_data.get("HUM"))
+
+    # Other parameters
+    lht = domus_data.get("LHT") if domus_data.get("LHT") not in [None, "NA", ""] else "Unknown"
+    pir = domus_data.get("PIR") if domus_data.get("PIR") not in [None, "NA", ""] else "Unknown"
+    tl = domus_data.get("TL") if domus_data.get("TL") not in [None, "NA", ""] else "Unknown"
+    th = domus_data.get("TH") if domus_data.get("TH") not in [None, "NA", ""] else "Unknown"
+
+    state = temperature if temperature is not None else "Unknown"
+    return state, {
+        "temperature": temperature if temperature is not None else "Unknown",
+        "humidity": humidity if humidity is not None else "Unknown",
+        "light": lht,
+        "pir": pir,
+        "tl": tl,
+        "th": th
+    }
+
+
+def _parse_partitions(sensor_data):
+    raw_arm = sensor_data.get("ARM", "")
+    arm_desc = PARTITION_ARM_MAP.get(raw_arm, raw_arm)
+    if raw_arm in ("IT", "OT"):
+        timer = sensor_data.get("T", 0)
+        state = f"{arm_desc} ({timer}s)"
+    else:
+        state = arm_desc
+
+    attrs = {
+        "Partition":            sensor_data.get("ID"),
+        "Description":          sensor_data.get("DES"),
+        "Arming Mode":          raw_arm,
+        "Arming Description":   arm_desc,
+        "Alarm Mode":           sensor_data.get("AST"),
+        "Alarm Description":    PARTITION_AST_MAP.get(sensor_data.get("AST", ""), ""),
+        "Tamper Mode":          sensor_data.get("TST"),
+        "Tamper Description":   PARTITION_TST_MAP.get(sensor_data.get("TST", ""), ""),
+    }
+    if sensor_data.get("TIN") is not None:
+        attrs["entry_delay"] = sensor_data["TIN"]
+    if sensor_data.get("TOUT") is not None:
+        attrs["exit_delay"] = sensor_data["TOUT"]
+    return state, attrs
+
+
+def _parse_default(sensor_data):
+    return sensor_data.get("STA", "unknown"), sensor_data
+
+
+_PARSERS = {
+    "door": _parse_contact,
+    "window": _parse_contact,
+    "pmc": _parse_pmc,
+    "cmd": _parse_cmd,
+    "imov": _parse_movement,
+    "emov": _parse_movement,
+    "seism": _parse_seism,
+    "system": _parse_system,
+    "powerlines": _parse_powerlines,
+    "domus": _parse_domus,
+    "partitions": _parse_partitions,
+}
+
+
+# WebSocketManager.get_cached() key used to refresh each sensor type, None for types only
+# updated by realtime data; other types use their upper-cased name
+_FETCH_KEYS = {
+    "partitions": "PARTITIONS",
+    "powerlines": "POWER_LINES",
+    "domus": "DOMUS",
+    "system": None,
+    "zones": None,
+    "door": None,
+    "window": None,
+    "pmc": None,
+    "imov": None,
+    "emov": None,
+}
+
+
+# Fields read by the parsers of the types whose payloads carry extra, unused data
+_SIGNATURE_FIELDS = {
+    "partitions": ("ID", "DES", "ARM", "T", "AST", "TST", "TIN", "TOUT"),
+    "powerlines": ("PCONS", "PPROD", "STATUS"),
+}
+
+
+"""
+Computes a cheap signature of a sensor payload, used to skip parsing when nothing changed.
+
+When the fields read by the parser are known, only those are compared, so changes
+in unused fields do not trigger a new parse. Otherwise the whole payload is used;
+payloads with nested values (e.g. DOMUS, ARM) are not hashable and have no
+signature, they are simply parsed again.
+
+:return: The signature itself (compared by equality, not by hash), None if there is none
+"""
+def _payload_signature(sensor_data, fields=None):
+    if fields is not None:
+        return tuple(sensor_data.get(field) for field in fields)
+    try:
+        return frozenset(sensor_data.items())
+    except TypeError:
+        return None
+
 
 class KseniaSensorEntity(SensorEntity):
 
+    # Keep the per-entity fields in fixed slots, as there can be hundreds of sensors
+    __slots__ = ("ws_manager", "_id", "_sensor_type", "_name", "_state", "_attributes", "_last_payload_signature")
+
     """
     Initializes a Ksenia sensor entity.
 
@@ -64,709 +387,94 @@ class KseniaSensorEntity(SensorEntity):
     def __init__(self, ws_manager, sensor_data, sensor_type):
         self.ws_manager = ws_manager
         self._id = sensor_data["ID"]
-        self._sensor_type = sensor_type
-        self._name = sensor_data.get("NM") or sensor_data.get("LBL") or sensor_data.get("DES") or f"Sensor {sensor_type.capitalize()} {self._id}"
-
-        if sensor_data.get("CAT", "").upper() == "DOOR" or sensor_type == "door":
-            attributes = {}
-            if "DES" in sensor_data:
-                attributes["Description"] = sensor_data["DES"]
-            if "PRT" in sensor_data:
-                attributes["Partition"] = sensor_data["PRT"]
-            if "CMD" in sensor_data:
-                attributes["Command"] = "Fixed" if sensor_data["CMD"] == "F" else sensor_data["CMD"]
-            if "BYP EN" in sensor_data:
-                attributes["Bypass Enabled"] = "Yes" if sensor_data["BYP EN"] == "T" else "No"
-            if "AN" in sensor_data:
-                attributes["Signal Type"] = "Analog" if sensor_data["AN"] == "T" else "Digital"
-            state_mapping = {"R": "Closed", "A": "Open"}
-            mapped_state = state_mapping.get(sensor_data.get("STA"), sensor_data.get("STA", "unknown"))
-            attributes["State"] = mapped_state
-            sensor_data.pop("STA", None)
-            if "BYP" in sensor_data:
-                attributes["Bypass"] = "Active" if sensor_data["BYP"].upper() not in ["NO", "N"] else "Inactive"
-            if "T" in sensor_data:
-                attributes["Tamper"] = "Yes" if sensor_data["T"] == "T" else "No"
-            if "A" in sensor_data:
-                attributes["Alarm"] = "On" if sensor_data["A"] == "T" else "Off"
-            if "FM" in sensor_data:
-                attributes["Fault Memory"] = "Yes" if sensor_data["FM"] == "T" else "No"
-            if "OHM" in sensor_data:
-                attributes["Resistance"] = sensor_data["OHM"] if sensor_data["OHM"] != "NA" else "N/A"
-            if "VAS" in sensor_data:
-                attributes["Voltage Alarm Sensor"] = "Active" if sensor_data["VAS"] == "T" else "Inactive"
-            if "LBL" in sensor_data and sensor_data["LBL"]:
-                attributes["Label"] = sensor_data["LBL"]
-
-            self._state = mapped_state
-            self._attributes = attributes
-            self._sensor_type = "door"
-            self._name = f"Door Sensor {sensor_data.get('NM') or sensor_data.get('LBL') or sensor_data.get('DES') or self._id}"
-
-
-        elif sensor_data.get("CAT", "").upper() == "WINDOW" or sensor_type == "window":
-            attributes = {}
-            if "DES" in sensor_data:
-                attributes["Description"] = sensor_data["DES"]
-            if "PRT" in sensor_data:
-                attributes["Partition"] = sensor_data["PRT"]
-            if "CMD" in sensor_data:
-                attributes["Command"] = "Fixed" if sensor_data["CMD"] == "F" else sensor_data["CMD"]
-            if "BYP EN" in sensor_data:
-                attributes["Bypass Enabled"] = "Yes" if sensor_data["BYP EN"] == "T" else "No"
-            if "AN" in sensor_data:
-                attributes["Signal Type"] = "Analog" if sensor_data["AN"] == "T" else "Digital"
-            state_mapping = {"R": "Closed", "A": "Open"}
-            mapped_state = state_mapping.get(sensor_data.get("STA"), sensor_data.get("STA", "unknown"))
-            attributes["State"] = mapped_state
-            sensor_data.pop("STA", None)
-            if "BYP" in sensor_data:
-                attributes["Bypass"] = "Active" if sensor_data["BYP"].upper() not in ["NO", "N"] else "Inactive"
-            if "T" in sensor_data:
-                attributes["Tamper"] = "Yes" if sensor_data["T"] == "T" else "No"
-            if "A" in sensor_data:
-                attributes["Alarm"] = "On" if sensor_data["A"] == "T" else "Off"
-            if "FM" in sensor_data:
-                attributes["Fault Memory"] = "Yes" if sensor_data["FM"] == "T" else "No"
-            if "OHM" in sensor_data:
-                attributes["Resistance"] = sensor_data["OHM"] if sensor_data["OHM"] != "NA" else "N/A"
-            if "VAS" in sensor_data:
-                attributes["Voltage Alarm Sensor"] = "Active" if sensor_data["VAS"] == "T" else "Inactive"
-            if "LBL" in sensor_data and sensor_data["LBL"]:
-                attributes["Label"] = sensor_data["LBL"]
-
-            self._state = mapped_state
-            self._attributes = attributes
-            self._sensor_type = "window"
-            self._name = f"Window Sensor {sensor_data.get('NM') or sensor_data.get('LBL') or sensor_data.get('DES') or self._id}"
-
-
-        elif sensor_data.get("CAT", "").upper() == "CMD" or sensor_type == "cmd":
-            attributes = {}
-            if "DES" in sensor_data:
-                attributes["Description"] = sensor_data["DES"]
-            if "PRT" in sensor_data:
-                attributes["Partition"] = sensor_data["PRT"]
-            # Command type: "T" means Trigger
-            if "CMD" in sensor_data:
-                attributes["Command"] = "Trigger" if sensor_data["CMD"] == "T" else sensor_data["CMD"]
-            if "BYP EN" in sensor_data:
-                attributes["Bypass Enabled"] = "Yes" if sensor_data["BYP EN"] == "T" else "No"
-            if "AN" in sensor_data:
-                attributes["Signal Type"] = "Analog" if sensor_data["AN"] == "T" else "Digital"
-            if "STA" in sensor_data:
-                state_mapping = {"R": "Released", "A": "Armed", "D": "Disarmed"}
-                attributes["State"] = state_mapping.get(sensor_data["STA"], sensor_data["STA"])
-            if "BYP" in sensor_data:
-                attributes["Bypass"] = "Active" if sensor_data["BYP"].upper() not in ["NO", "N"] else "Inactive"
-            if "T" in sensor_data:
-                attributes["Tamper"] = "Yes" if sensor_data["T"] == "T" else "No"
-            if "A" in sensor_data:
-                attributes["Alarm"] = "On" if sensor_data["A"] == "T" else "Off"
-            if "FM" in sensor_data:
-                attributes["Fault Memory"] = "Yes" if sensor_data["FM"] == "T" else "No"
-            if "OHM" in sensor_data:
-                attributes["Resistance"] = sensor_data["OHM"] if sensor_data["OHM"] != "NA" else "N/A"
-            if "VAS" in sensor_data:
-                attributes["Voltage Alarm Sensor"] = "Active" if sensor_data["VAS"] == "T" else "Inactive"
-            if "LBL" in sensor_data and sensor_data["LBL"]:
-                attributes["Label"] = sensor_data["LBL"]
-
-            self._state = sensor_data.get("STA", "unknown")
-            self._attributes = attributes
-            self._sensor_type = "cmd"
-            self._name = sensor_data.get('NM') or sensor_data.get('LBL') or sensor_data.get('DES') or f"Command Sensor {self._id}"
-
-        elif sensor_data.get("CAT", "").upper() == "IMOV" or sensor_data.get("CAT", "").upper() == "EMOV":
-            attributes = {}
-            if "DES" in sensor_data:
-                attributes["Description"] = sensor_data["DES"]
-            if "PRT" in sensor_data:
-                attributes["Partition"] = sensor_data["PRT"]
-            if "BYP EN" in sensor_data:
-                attributes["Bypass Enabled"] = "Yes" if sensor_data["BYP EN"] == "T" else "No"
-            if "AN" in sensor_data:
-                attributes["Signal Type"] = "Analog" if sensor_data["AN"] == "T" else "Digital"
-            if "STA" in sensor_data:
-                state_mapping = {"R": "Off", "A": "On"}
-                mapped_state = state_mapping.get(sensor_data.get("STA"), sensor_data.get("STA", "unknown"))
-                attributes["State"] = mapped_state
-                sensor_data.pop("STA", None)
-            if "BYP" in sensor_data:
-                attributes["Bypass"] = "Active" if sensor_data["BYP"].upper() not in ["NO", "N"] else "Inactive"
-            if "T" in sensor_data:
-                attributes["Tamper"] = "Yes" if sensor_data["T"] == "T" else "No"
-            if "A" in sensor_data:
-                attributes["Alarm"] = "On" if sensor_data["A"] == "T" else "Off"
-            if "FM" in sensor_data:
-                attributes["Fault Memory"] = "Yes" if sensor_data["FM"] == "T" else "No"
-            if "OHM" in sensor_data:
-                attributes["Resistance"] = sensor_data["OHM"] if sensor_data["OHM"] != "NA" else "N/A"
-            if "VAS" in sensor_data:
-                attributes["Voltage Alarm Sensor"] = "Active" if sensor_data["VAS"] == "T" else "Inactive"
-            if "LBL" in sensor_data and sensor_data["LBL"]:
-                attributes["Label"] = sensor_data["LBL"]
-
-            self._state = mapped_state
-            self._attributes = attributes
-            if sensor_data.get("CAT", "").upper() == "EMOV":
-                self._sensor_type = "emov"
-                self._name = f"External Movement Sensor {sensor_data.get('NM') or sensor_data.get('LBL') or sensor_data.get('DES') or self._id}"
-            else:
-                self._sensor_type = "imov"
-                self._name = f"Internal Movement Sensor {sensor_data.get('NM') or sensor_data.get('LBL') or sensor_data.get('DES') or self._id}"
-
-        elif sensor_data.get("CAT", "").upper() == "PMC":
-            attributes = {}
-            if "DES" in sensor_data:
-                attributes["Description"] = sensor_data["DES"]
-            if "PRT" in sensor_data:
-                attributes["Partition"] = sensor_data["PRT"]
-            if "CMD" in sensor_data:
-                attributes["Command"] = "Fixed" if sensor_data["CMD"] == "F" else sensor_data["CMD"]
-            if "BYP EN" in sensor_data:
-                attributes["Bypass Enabled"] = "Yes" if sensor_data["BYP EN"] == "T" else "No"
-            if "AN" in sensor_data:
-                attributes["Signal Type"] = "Analog" if sensor_data["AN"] == "T" else "Digital"
-            if "STA" in sensor_data:
-                state_mapping = {"R": "Closed", "A": "Open"}
-                mapped_state = state_mapping.get(sensor_data["STA"], sensor_data["STA"])
-                attributes["State"] = mapped_state
-            if "BYP" in sensor_data:
-                attributes["Bypass"] = (
-                    "Active" if sensor_data["BYP"].upper() not in ["NO", "N"] else "Inactive"
-                )
-            if "T" in sensor_data:
-                attributes["Tamper"] = "Yes" if sensor_data["T"] == "T" else "No"
-            if "A" in sensor_data:
-                attributes["Alarm"] = "On" if sensor_data["A"] == "T" else "Off"
-            if "FM" in sensor_data:
-                attributes["Fault Memory"] = "Yes" if sensor_data["FM"] == "T" else "No"
-            if "OHM" in sensor_data:
-                attributes["Resistance"] = sensor_data["OHM"] if sensor_data["OHM"] != "NA" else "N/A"
-            if "VAS" in sensor_data:
-                attributes["Voltage Alarm Sensor"] = "Active" if sensor_data["VAS"] == "T" else "Inactive"
-            if "LBL" in sensor_data and sensor_data["LBL"]:
-                attributes["Label"] = sensor_data["LBL"]
-
-            self._state = mapped_state
-            self._attributes = attributes
-            self._sensor_type = "pmc"
-            self._name = f"Perimetral Magnetic Contact Sensor {sensor_data.get('NM') or sensor_data.get('LBL') or sensor_data.get('DES') or self._id}"
-
-        elif sensor_data.get("CAT", "").upper() == "SEISM" or sensor_type == "seism":
-            attributes = {}
-            if "DES" in sensor_data:
-                attributes["Description"] = sensor_data["DES"]
-            if "PRT" in sensor_data:
-                attributes["Partition"] = sensor_data["PRT"]
-            state_mapping = {
-                "R": "Rest",
-                "A": "Seismic Activity",
-                "N": "Normal"
-            }
-            mapped_state = state_mapping.get(sensor_data.get("STA"), sensor_data.get("STA", "unknown"))
-            attributes["State"] = mapped_state
-            if "BYP" in sensor_data:
-                attributes["Bypass"] = "Active" if sensor_data["BYP"].upper() not in ["NO", "N"] else "Inactive"
-            if "T" in sensor_data:
-                attributes["Tamper"] = "Yes" if sensor_data["T"] == "T" else "No"
-            if "A" in sensor_data:
-                attributes["Alarm"] = "On" if sensor_data["A"] == "T" else "Off"
-            if "FM" in sensor_data:
-                attributes["Fault Memory"] = "Yes" if sensor_data["FM"] == "T" else "No"
-
-            self._state = mapped_state
-            self._attributes = attributes
-            self._sensor_type = "seism"
-            self._name = f"Seismic Sensor {sensor_data.get('NM') or sensor_data.get('LBL') or sensor_data.get('DES') or self._id}"
+        label = sensor_data.get("NM") or sensor_data.get("LBL") or sensor_data.get("DES")
+        self._name = label or f"Sensor {sensor_type.capitalize()} {self._id}"
 
-        elif sensor_type == "system":
-            arm_data = sensor_data.get("ARM", {})
-            state_code = arm_data.get("S")
-            if state_code is None:
-                _LOGGER.error(
-                    "Ksenia system sensor %s: 'S' key missing in ARM; ARM data received: %r",
-                    self._id, arm_data
-                )
-                state_code = ""
-            state_mapping = {
-                "T": "Fully Armed",
-                "T_IN": "Fully Armed with Entry Delay Active",
-                "T_OUT": "Fully Armed with Exit Delay Active",
-                "P": "Partially Armed",
-                "P_IN": "Partially Armed with Entry Delay Active",
-                "P_OUT": "Partially Armed with Exit Delay Active",
-                "D": "Disarmed"
-            }
-            readable_state = state_mapping.get(state_code, state_code)
-            if state_code not in state_mapping:
-                _LOGGER.error(
-                    "Ksenia system sensor %s: unwanted ARM code %r → cannot map!",
-                    self._id, state_code
-                )
-
-            self._state = readable_state
-            self._name = f"Alarm System Status {sensor_data.get('NM') or sensor_data.get('LBL') or sensor_data.get('DES') or self._id}"
-            self._attributes = {}
+        category = sensor_data.get("CAT", "").lower()
+        if category in ZONE_CATEGORIES:
+            sensor_type = category
+        self._sensor_type = sensor_type
 
+        self._state = None
+        self._attributes = {}
+        self._last_payload_signature = None
+        self.prime(sensor_data)
 
+        if sensor_type == "cmd":
+            self._name = label or f"Command Sensor {self._id}"
+        elif sensor_type in ZONE_NAME_PREFIX:
+            self._name = f"{ZONE_NAME_PREFIX[sensor_type]} {label or self._id}"
+        elif sensor_type == "system":
+            self._name = f"Alarm System Status {label or self._id}"
         elif sensor_type == "powerlines":
-            # Extract consumption and production
-            pcons = sensor_data.get("PCONS")
-            try:
-                pcons_val = float(pcons) if pcons and pcons.replace('.', '', 1).isdigit() else None
-            except Exception as e:
-                _LOGGER.error("Error converting PCONS: %s", e)
-                pcons_val = None
-            pprod = sensor_data.get("PPROD")
-            try:
-                pprod_val = float(pprod) if pprod and pprod.replace('.', '', 1).isdigit() else None
-            except Exception as e:
-                _LOGGER.error("Error converting PPROD: %s", e)
-                pprod_val = None
-            # Use PCONS if it exists, otherwise use STATUS
-            consumo_kwh = round(pcons_val / 1000, 3) if pcons_val is not None else None
-            self._state = pcons_val if pcons_val is not None else sensor_data.get("STATUS", "Unknown")
-            self._attributes = {
-                "Consumption": consumo_kwh,
-                "Production": pprod_val,
-                "Status": sensor_data.get("STATUS", "Unknown")
-            }
-            if consumo_kwh is not None:
+            if self._attributes.get("Consumption") is not None:
                 self._name = f"Cons: {self._name}"
-
-        elif sensor_type == "domus":
-            domus_data = sensor_data.get("DOMUS", {})
-            if not isinstance(domus_data, dict):
-                domus_data = {}
-            try:
-                temp_str = domus_data.get("TEM")
-                temperature = float(temp_str.replace("+", "")) if temp_str and temp_str not in ["NA", ""] else None
-            except Exception as e:
-                _LOGGER.error("Error converting temperature in domus sensor: %s", e)
-                temperature = None
-            try:
-                hum_str = domus_data.get("HUM")
-                humidity = float(hum_str) if hum_str and hum_str not in ["NA", ""] else None
-            except Exception as e:
-                _LOGGER.error("Error converting humidity in domus sensor: %s", e)
-                humidity = None
-
-            # Other parameters
-            lht = domus_data.get("LHT") if domus_data.get("LHT") not in [None, "NA", ""] else "Unknown"
-            pir = domus_data.get("PIR") if domus_data.get("PIR") not in [None, "NA", ""] else "Unknown"
-            tl = domus_data.get("TL") if domus_data.get("TL") not in [None, "NA", ""] else "Unknown"
-            th = domus_data.get("TH") if domus_data.get("TH") not in [None, "NA", ""] else "Unknown"
-
-            state_value = temperature if temperature is not None else "Unknown"
-            self._state = state_value
-            self._attributes = {
-                "temperature": temperature if temperature is not None else "Unknown",
-                "humidity": humidity if humidity is not None else "Unknown",
-                "light": lht,
-                "pir": pir,
-                "tl": tl,
-                "th": th
-            }
-
         elif sensor_type == "partitions":
-            ARM_MAP = {
-                "D":  "Disarmed",
-                "DA": "Delayed Arming",
-                "IA": "Immediate Arming",
-                "IT": "Input time",
-                "OT": "Output time",
-            }
-            AST_MAP = {
-                "OK": "No ongoing alarm",
-                "AL": "Ongoing alarm",
-                "AM": "Alarm memory",
-            }
-            TST_MAP = {
-                "OK":  "No ongoing tampering",
-                "TAM": "Ongoing tampering",
-                "TM":  "Tampering memory",
-            }
-            raw_arm = sensor_data.get("ARM", "")
-            arm_desc = ARM_MAP.get(raw_arm, raw_arm)
-            if raw_arm in ("IT", "OT"):
-                timer = sensor_data.get("T", 0)
-                state = f"{arm_desc} ({timer}s)"
-            else:
-                state = arm_desc
-            self._state = state
-
-            attrs = {
-                "Partition":    sensor_data.get("ID"),
-                "Description":     sensor_data.get("DES"),
-                "Arming Mode":     raw_arm,
-                "Arming Description":     arm_desc,
-                "Alarm Mode":      sensor_data.get("AST"),
-                "Alarm Description":      AST_MAP.get(sensor_data.get("AST", ""), ""),
-                "Tamper Mode":     sensor_data.get("TST"),
-                "Tamper Description":     TST_MAP.get(sensor_data.get("TST", ""), ""),
-            }
-
-            if sensor_data.get("TIN") is not None:
-                attrs["entry_delay"] = sensor_data["TIN"]
-            if sensor_data.get("TOUT") is not None:
-                attrs["exit_delay"] = sensor_data["TOUT"]
-
-            self._attributes = attrs
             self._name = f"Part: {self._name}"
 
-        else:
-            self._state = sensor_data.get("STA", "unknown")
-            self._attributes = sensor_data
+    """
+    Sets the state and attributes of the sensor from already fetched data.
+
+    The payload is always parsed, even if it matches the last one applied.
+
+    :param sensor_data: Dictionary with the sensor data
+    """
+    def prime(self, sensor_data):
+        self._last_payload_signature = None
+        self._apply_payload(sensor_data)
+
+    """
+    Parses a sensor payload and stores the resulting state and attributes.
+
+    Parsing is skipped when the payload signature matches the last one applied;
+    payloads without a signature are always parsed. Nothing is reported as
+    changed when the parsed state and attributes are the same as the current
+    ones, so no state write is needed.
+
+    :param sensor_data: Dictionary with the sensor data
+    :return: True if the state or attributes changed, False otherwise
+    """
+    def _apply_payload(self, sensor_data):
+        signature = _payload_signature(sensor_data, _SIGNATURE_FIELDS.get(self._sensor_type))
+        if signature is not None and signature == self._last_payload_signature:
+            return False
+        self._last_payload_signature = signature
+        parser = _PARSERS.get(self._sensor_type, _parse_default)
+        state, attributes = parser(sensor_data)
+        if state == self._state and attributes == self._attributes:
+            return False
+        self._state, self._attributes = state, attributes
+        return True
 
     """
     Register the sensor entity to start receiving real-time updates.
 
     This method is called when the entity is added to Home Assistant.
-    It registers a listener for the specific sensor type or 'systems'
-    if the sensor type is 'system'. The listener will trigger the
-    `_handle_realtime_update` method when new data is received.
+    It registers a listener for its own ID on the realtime data of its type
+    ('zones' for every zone category, 'systems' for the system status).
+    The listener will trigger the `_handle_realtime_update` method when new
+    data is received for this entity, and is removed with the entity.
     """
     async def async_added_to_hass(self):
-        if self._sensor_type in ("door", "pmc", "window", "imov", "emov", "seism"):
+        if self._sensor_type in ZONE_CATEGORIES or self._sensor_type == "zones":
             key = "zones"
         else:
             key = self._sensor_type if self._sensor_type != "system" else "systems"
-        self.ws_manager.register_listener(key, self._handle_realtime_update)
+        self.async_on_remove(
+            self.ws_manager.register_entity_listener(key, self._id, self._handle_realtime_update)
+        )
 
     """
     Handle real-time updates for the sensor.
 
-    This method is called when a new set of data is received from the real-time API.
+    This method is called by the WebSocket manager with the realtime record of this sensor.
     It updates the state and attributes of the sensor based on the received data.
     """
-    async def _handle_realtime_update(self, data_list):
-        for data in data_list:
-            if str(data.get("ID")) != str(self._id):
-                continue
-
-            if self._sensor_type == "system":
-                for data in data_list:
-                    if str(data.get("ID")) != str(self._id):
-                        continue
-
-                    if "ARM" not in data or not isinstance(data["ARM"], dict):
-                        continue
-
-                    arm_data = data["ARM"]
-                    state_code = arm_data.get("S")
-                    state_mapping = {
-                        "T": "Fully Armed",
-                        "T_IN": "Fully Armed with Entry Delay Active",
-                        "T_OUT": "Fully Armed with Exit Delay Active",
-                        "P": "Partially Armed",
-                        "P_IN": "Partially Armed with Entry Delay Active",
-                        "P_OUT": "Partially Armed with Exit Delay Active",
-                        "D": "Disarmed"
-                    }
-                    readable_state = state_mapping.get(state_code, state_code)
-
-                    self._state = readable_state
-                    self._name = f"Alarm System Status {data.get('NM') or data.get('LBL') or data.get('DES') or self._id}"
-                    self._attributes = {}
-                    self.async_write_ha_state()
-                    break
-
-            elif self._sensor_type == "powerlines":
-                pcons = data.get("PCONS")
-                try:
-                    pcons_val = float(pcons) if pcons and pcons.replace('.', '', 1).isdigit() else None
-                except Exception as e:
-                    _LOGGER.error("Error converting PCONS: %s", e)
-                    pcons_val = None
-                pprod = data.get("PPROD")
-                try:
-                    pprod_val = float(pprod) if pprod and pprod.replace('.', '', 1).isdigit() else None
-                except Exception as e:
-                    _LOGGER.error("Error converting PPROD: %s", e)
-                    pprod_val = None
-                consumo_kwh = round(pcons_val / 1000, 3) if pcons_val is not None else None
-                self._state = pcons_val if pcons_val is not None else data.get("STATUS", "unknown")
-                self._attributes = {
-                    "Consumption": consumo_kwh,
-                    "Production": pprod_val,
-                    "Status": data.get("STATUS", "unknown")
-                }
-
-            elif self._sensor_type == "domus" and self._sensor_type != "door":
-                domus_data = data.get("DOMUS", {})
-                if not isinstance(domus_data, dict):
-                    domus_data = {}
-                try:
-                    temp_str = domus_data.get("TEM")
-                    temperature = float(temp_str.replace("+", "")) if temp_str and temp_str not in ["NA", ""] else None
-                except Exception as e:
-                    _LOGGER.error("Error converting domus temperature: %s", e)
-                    temperature = None
-                try:
-                    hum_str = domus_data.get("HUM")
-                    humidity = float(hum_str) if hum_str and hum_str not in ["NA", ""] else None
-                except Exception as e:
-                    _LOGGER.error("Error converting domus humidity: %s", e)
-                    humidity = None
-                lht = domus_data.get("LHT") if domus_data.get("LHT") not in [None, "NA", ""] else "Unknown"
-                pir = domus_data.get("PIR") if domus_data.get("PIR") not in [None, "NA", ""] else "Unknown"
-                tl = domus_data.get("TL") if domus_data.get("TL") not in [None, "NA", ""] else "Unknown"
-                th = domus_data.get("TH") if domus_data.get("TH") not in [None, "NA", ""] else "Unknown"
-                self._state = temperature if temperature is not None else "Unknown"
-                self._attributes = {
-                    "temperature": temperature if temperature is not None else "Unknown",
-                    "humidity": humidity if humidity is not None else "Unknown",
-                    "light": lht,
-                    "pir": pir,
-                    "tl": tl,
-                    "th": th,
-                }
-
-            elif self._sensor_type == "partitions":
-                ARM_MAP = {
-                    "D":  "Disarmed",
-                    "DA": "Delayed Arming",
-                    "IA": "Immediate Arming",
-                    "IT": "Input time",
-                    "OT": "Output time",
-                }
-                AST_MAP = {
-                    "OK": "No ongoing alarm",
-                    "AL": "Ongoing alarm",
-                    "AM": "Alarm memory",
-                }
-                TST_MAP = {
-                    "OK":  "No ongoing tampering",
-                    "TAM": "Ongoing tampering",
-                    "TM":  "Tampering memory",
-                }
-
-                raw_arm = data.get("ARM", "")
-                arm_desc = ARM_MAP.get(raw_arm, raw_arm)
-                if raw_arm in ("IT", "OT"):
-                    timer = data.get("T", 0)
-                    self._state = f"{arm_desc} ({timer}s)"
-                else:
-                    self._state = arm_desc
-
-                attrs = {
-                    "Partition":            data.get("ID"),
-                    "Description":          data.get("DES"),
-                    "Arming Mode":          raw_arm,
-                    "Arming Description":   arm_desc,
-                    "Alarm Mode":           data.get("AST"),
-                    "Alarm Description":    AST_MAP.get(data.get("AST", ""), ""),
-                    "Tamper Mode":          data.get("TST"),
-                    "Tamper Description":   TST_MAP.get(data.get("TST", ""), ""),
-                }
-
-                if data.get("TIN") is not None:
-                    attrs["entry_delay"] = data.get("TIN")
-                if data.get("TOUT") is not None:
-                    attrs["exit_delay"] = data.get("TOUT")
-
-                self._attributes = attrs
-
-            elif self._sensor_type == "door" or self._sensor_type == "window":
-                for data in data_list:
-                    if str(data.get("ID")) == str(self._id):
-                        attributes = {}
-                        if "DES" in data:
-                            attributes["Description"] = data["DES"]
-                        if "PRT" in data:
-                            attributes["Partition"] = data["PRT"]
-                        if "CMD" in data:
-                            attributes["Command"] = "Fixed" if data["CMD"] == "F" else data["CMD"]
-                        if "BYP EN" in data:
-                            attributes["Bypass Enabled"] = "Yes" if data["BYP EN"] == "T" else "No"
-                        if "AN" in data:
-                            attributes["Signal Type"] = "Analog" if data["AN"] == "T" else "Digital"
-                        state_mapping = {"R": "Closed", "A": "Open"}
-                        mapped_state = state_mapping.get(data.get("STA"), data.get("STA", "unknown"))
-                        attributes["State"] = mapped_state
-                        data.pop("STA", None)
-                        if "BYP" in data:
-                            attributes["Bypass"] = "Active" if data["BYP"].upper() not in ["NO", "N"] else "Inactive"
-                        if "T" in data:
-                            attributes["Tamper"] = "Yes" if data["T"] == "T" else "No"
-                        if "A" in data:
-                            attributes["Alarm"] = "On" if data["A"] == "T" else "Off"
-                        if "FM" in data:
-                            attributes["Fault Memory"] = "Yes" if data["FM"] == "T" else "No"
-                        if "OHM" in data:
-                            attributes["Resistance"] = data["OHM"] if data["OHM"] != "NA" else "N/A"
-                        if "VAS" in data:
-                            attributes["Voltage Alarm Sensor"] = "Active" if data["VAS"] == "T" else "Inactive"
-                        if "LBL" in data and data["LBL"]:
-                            attributes["Label"] = data["LBL"]
-
-                        self._state = mapped_state
-                        self._attributes = attributes
-                        self.async_write_ha_state()
-                        break
-
-
-            elif self._sensor_type == "cmd":
-                for data in data_list:
-                    if str(data.get("ID")) == str(self._id) and data.get("CAT", "").upper() == "CMD":
-                        attributes = {}
-                        if "DES" in data:
-                            attributes["Description"] = data["DES"]
-                        if "PRT" in data:
-                            attributes["Partition"] = data["PRT"]
-                        if "CMD" in data:
-                            attributes["Command"] = "Trigger" if data["CMD"] == "T" else data["CMD"]
-                        if "BYP EN" in data:
-                            attributes["Bypass Enabled"] = "Yes" if data["BYP EN"] == "T" else "No"
-                        if "AN" in data:
-                            attributes["Signal Type"] = "Analog" if data["AN"] == "T" else "Digital"
-                        if "STA" in data:
-                            state_mapping = {"R": "Released", "A": "Armed", "D": "Disarmed"}
-                            attributes["State"] = state_mapping.get(data["STA"], data["STA"])
-                        if "BYP" in data:
-                            attributes["Bypass"] = "Active" if data["BYP"].upper() not in ["NO", "N"] else "Inactive"
-                        if "T" in data:
-                            attributes["Tamper"] = "Yes" if data["T"] == "T" else "No"
-                        if "A" in data:
-                            attributes["Alarm"] = "On" if data["A"] == "T" else "Off"
-                        if "FM" in data:
-                            attributes["Fault Memory"] = "Yes" if data["FM"] == "T" else "No"
-                        if "OHM" in data:
-                            attributes["Resistance"] = data["OHM"] if data["OHM"] != "NA" else "N/A"
-                        if "VAS" in data:
-                            attributes["Voltage Alarm Sensor"] = "Active" if data["VAS"] == "T" else "Inactive"
-                        if "LBL" in data and data["LBL"]:
-                            attributes["Label"] = data["LBL"]
-
-                        self._state = data.get("STA", "unknown")
-                        self._attributes = attributes
-                        self.async_write_ha_state()
-                        break
-
-            elif self._sensor_type == "imov" or self._sensor_type == "emov":
-                for data in data_list:
-                    if str(data.get("ID")) == str(self._id):
-                        attributes = {}
-                        if "DES" in data:
-                            attributes["Description"] = data["DES"]
-                        if "PRT" in data:
-                            attributes["Partition"] = data["PRT"]
-                        if "BYP EN" in data:
-                            attributes["Bypass Enabled"] = "Yes" if data["BYP EN"] == "T" else "No"
-                        if "AN" in data:
-                            attributes["Signal Type"] = "Analog" if data["AN"] == "T" else "Digital"
-                        if "STA" in data:
-                            state_mapping = {"R": "Off", "A": "On"}
-                            mapped_state = state_mapping.get(data.get("STA"), data.get("STA", "unknown"))
-                            attributes["State"] = mapped_state
-                            data.pop("STA", None)
-                        if "BYP" in data:
-                            attributes["Bypass"] = "Active" if data["BYP"].upper() not in ["NO", "N"] else "Inactive"
-                        if "T" in data:
-                            attributes["Tamper"] = "Yes" if data["T"] == "T" else "No"
-                        if "A" in data:
-                            attributes["Alarm"] = "On" if data["A"] == "T" else "Off"
-                        if "FM" in data:
-                            attributes["Fault Memory"] = "Yes" if data["FM"] == "T" else "No"
-                        if "OHM" in data:
-                            attributes["Resistance"] = data["OHM"] if data["OHM"] != "NA" else "N/A"
-                        if "VAS" in data:
-                            attributes["Voltage Alarm Sensor"] = "Active" if data["VAS"] == "T" else "Inactive"
-                        if "LBL" in data and data["LBL"]:
-                            attributes["Label"] = data["LBL"]
-
-                        self._state = mapped_state
-                        self._attributes = attributes
-                        self.async_write_ha_state()
-                        break
-                
-            elif self._sensor_type == "pmc":
-                for data in data_list:
-                    if str(data.get("ID")) == str(self._id):
-                        attributes = {}
-                        if "DES" in data:
-                            attributes["Description"] = data["DES"]
-                        if "PRT" in data:
-                            attributes["Partition"] = data["PRT"]
-                        # Command
-                        if "CMD" in data:
-                            attributes["Command"] = "Fixed" if data["CMD"] == "F" else data["CMD"]
-                        # Bypass Enabled
-                        if "BYP EN" in data:
-                            attributes["Bypass Enabled"] = "Yes" if data["BYP EN"] == "T" else "No"
-                        # Signal Type
-                        if "AN" in data:
-                            attributes["Signal Type"] = "Analog" if data["AN"] == "T" else "Digital"
-                        # Status
-                        if "STA" in data:
-                            state_mapping = {"R": "Closed", "A": "Open"}
-                            mapped_state = state_mapping.get(data["STA"], data["STA"])
-                            attributes["State"] = mapped_state
-                        # Bypass
-                        if "BYP" in data:
-                            attributes["Bypass"] = "Active" if data["BYP"].upper() not in ["NO", "N"] else "Inactive"
-                        # Tamper
-                        if "T" in data:
-                            attributes["Tamper"] = "Yes" if data["T"] == "T" else "No"
-                        # Alarm
-                        if "A" in data:
-                            attributes["Alarm"] = "On" if data["A"] == "T" else "Off"
-                        # Fault Memory
-                        if "FM" in data:
-                            attributes["Fault Memory"] = "Yes" if data["FM"] == "T" else "No"
-                        # Resistance
-                        if "OHM" in data:
-                            attributes["Resistance"] = data["OHM"] if data["OHM"] != "NA" else "N/A"
-                        # Voltage Alarm Sensor
-                        if "VAS" in data:
-                            attributes["Voltage Alarm Sensor"] = "Active" if data["VAS"] == "T" else "Inactive"
-                        # Label
-                        if "LBL" in data and data["LBL"]:
-                            attributes["Label"] = data["LBL"]
-
-                        self._state = mapped_state
-                        self._attributes = attributes
-                        self.async_write_ha_state()
-                        break
-
-            elif self._sensor_type == "seism":
-                for data in data_list:
-                    if str(data.get("ID")) == str(self._id):
-                        state_mapping = {
-                            "R": "Rest",
-                            "A": "Seismic Activity",
-                            "N": "Normal"
-                        }
-                        raw_state = data.get("STA")
-                        mapped_state = state_mapping.get(raw_state, raw_state or "Unknown")
-
-                        attributes = {
-                            "ID": data.get("ID"),
-                            "State": mapped_state,
-                            "Bypass": "Active" if data.get("BYP", "").upper() not in ["NO", "N"] else "Inactive",
-                            "Tamper": "Yes" if data.get("T") == "T" else "No",
-                            "Alarm": "On" if data.get("A") == "T" else "Off",
-                            "Fault Memory": "Yes" if data.get("FM") == "T" else "No",
-                            "Resistance": data.get("OHM") if data.get("OHM") != "NA" else "N/A",
-                            "Voltage Alarm Sensor": "Active" if data.get("VAS") == "T" else "Inactive",
-                        }
-                        if data.get("LBL"):
-                            attributes["Label"] = data.get("LBL")
-
-                        self._state = mapped_state
-                        self._attributes = attributes
-                        self.async_write_ha_state()
-                        break
-
-
-            else:
-                self._state = data.get("STA", "unknown")
-                self._attributes = data
-
+    async def _handle_realtime_update(self, data):
+        if self._sensor_type == "system" and not isinstance(data.get("ARM"), dict):
+            return
+        if self._apply_payload(data):
             self.async_write_ha_state()
-            break
 
     @property
     def unique_id(self):
@@ -812,174 +520,22 @@ class KseniaSensorEntity(SensorEntity):
     @property
     def should_poll(self) -> bool:
         """
-        Indicates if the sensor should be polled to retrieve its state.
+        Sensors are updated by the real-time data pushed by the WebSocket manager.
         """
-        if self._sensor_type in ("door", "pmc", "window", "imov", "emov"):
-            return False
-
-        return True
+        return False
 
     """
     Update the state of the sensor.
     
-    This method is called periodically by Home Assistant to refresh the sensor's state.
-    It retrieves the latest data from the Ksenia system and updates the sensor's state
-    and attributes accordingly.
+    Sensors are not polled, so this method is only called by Home Assistant when
+    a refresh of the entity is explicitly requested. It reads the latest data
+    received from the Ksenia system, kept current by the realtime updates, and
+    updates the sensor's state and attributes accordingly.
     """
     async def async_update(self):
-        if self._sensor_type == "system":
+        cache_key = _FETCH_KEYS.get(self._sensor_type, self._sensor_type.upper())
+        if cache_key is None:
             return
-        
-        elif self._sensor_type == "partitions":
-            sensors = await self.ws_manager.getSensor("PARTITIONS")
-            for sensor in sensors:
-                if str(sensor.get("ID")) != str(self._id):
-                    continue
-
-                # mappa gli stati esattamente come in __init__
-                ARM_MAP = {
-                    "D":  "Disarmed",
-                    "DA": "Delayed Arming",
-                    "IA": "Immediate Arming",
-                    "IT": "Input time",
-                    "OT": "Output time",
-                }
-                AST_MAP = {
-                    "OK": "No ongoing alarm",
-                    "AL": "Ongoing alarm",
-                    "AM": "Alarm memory",
-                }
-                TST_MAP = {
-                    "OK":  "No ongoing tampering",
-                    "TAM": "Ongoing tampering",
-                    "TM":  "Tampering memory",
-                }
-
-                raw_arm = sensor.get("ARM", "")
-                arm_desc = ARM_MAP.get(raw_arm, raw_arm)
-                if raw_arm in ("IT", "OT"):
-                    timer = sensor.get("T", 0)
-                    self._state = f"{arm_desc} ({timer}s)"
-                else:
-                    self._state = arm_desc
-
-                self._attributes = {
-                    "Partition":            sensor.get("ID"),
-                    "Description":          sensor.get("DES"),
-                    "Arming Mode":          raw_arm,
-                    "Arming Description":   arm_desc,
-                    "Alarm Mode":           sensor.get("AST"),
-                    "Alarm Description":    AST_MAP.get(sensor.get("AST", ""), ""),
-                    "Tamper Mode":          sensor.get("TST"),
-                    "Tamper Description":   TST_MAP.get(sensor.get("TST", ""), ""),
-                    **({"entry_delay": sensor["TIN"]} if sensor.get("TIN") is not None else {}),
-                    **({"exit_delay":  sensor["TOUT"]} if sensor.get("TOUT") is not None else {}),
-                }
-                break
-        
-        elif self._sensor_type == "powerlines":
-            sensors = await self.ws_manager.getSensor("POWER_LINES")
-            for sensor in sensors:
-                if sensor["ID"] == self._id:
-                    pcons = sensor.get("PCONS")
-                    try:
-                        pcons_val = float(pcons) if pcons and pcons.replace('.', '', 1).isdigit() else None
-                    except Exception as e:
-                        _LOGGER.error("Error converting PCONS: %s", e)
-                        pcons_val = None
-                    pprod = sensor.get("PPROD")
-                    try:
-                        pprod_val = float(pprod) if pprod and pprod.replace('.', '', 1).isdigit() else None
-                    except Exception as e:
-                        _LOGGER.error("Error converting PPROD: %s", e)
-                        pprod_val = None
-                    self._state = pcons_val if pcons_val is not None else sensor.get("STATUS", "unknown")
-                    self._attributes = {
-                        "Consumption": pcons_val,
-                        "Production": pprod_val,
-                        "Status": sensor.get("STATUS", "unknown")
-                    }
-                    break
-
-        elif self._sensor_type == "domus" and self._sensor_type != "door":
-            sensors = await self.ws_manager.getDom()
-            for sensor in sensors:
-                if sensor["ID"] == self._id:
-                    domus_data = sensor.get("DOMUS", {})
-                    if not isinstance(domus_data, dict):
-                        domus_data = {}
-                    try:
-                        temp_str = domus_data.get("TEM")
-                        temperature = float(temp_str.replace("+", "")) if temp_str and temp_str not in ["NA", ""] else None
-                    except Exception as e:
-                        _LOGGER.error("Error converting temperature: %s", e)
-                        temperature = None
-                    try:
-                        hum_str = domus_data.get("HUM")
-                        humidity = float(hum_str) if hum_str and hum_str not in ["NA", ""] else None
-                    except Exception as e:
-                        _LOGGER.error("Error converting humidity: %s", e)
-                        humidity = None
-                    lht = domus_data.get("LHT") if domus_data.get("LHT") not in [None, "NA", ""] else "Unknown"
-                    pir = domus_data.get("PIR") if domus_data.get("PIR") not in [None, "NA", ""] else "Unknown"
-                    tl = domus_data.get("TL") if domus_data.get("TL") not in [None, "NA", ""] else "Unknown"
-                    th = domus_data.get("TH") if domus_data.get("TH") not in [None, "NA", ""] else "Unknown"
-                    state_value = temperature if temperature is not None else "Unknown"
-                    self._state = state_value
-                    self._attributes = {
-                        "temperature": temperature if temperature is not None else "Unknown",
-                        "humidity": humidity if humidity is not None else "Unknown",
-                        "light": lht,
-                        "pir": pir,
-                        "tl": tl,
-                        "th": th,
-                    }
-                    break
-
-        elif self._sensor_type == "cmd":
-            sensors = await self.ws_manager.getSensor("CMD")
-            for sensor in sensors:
-                if sensor["ID"] == self._id and sensor.get("CAT", "").upper() == "CMD":
-                    attributes = {}
-                    if "DES" in sensor:
-                        attributes["Description"] = sensor["DES"]
-                    if "PRT" in sensor:
-                        attributes["Partition"] = sensor["PRT"]
-                    if "CMD" in sensor:
-                        attributes["Command"] = "Trigger" if sensor["CMD"] == "T" else sensor["CMD"]
-                    if "BYP EN" in sensor:
-                        attributes["Bypass Enabled"] = "Yes" if sensor["BYP EN"] == "T" else "No"
-                    if "AN" in sensor:
-                        attributes["Signal Type"] = "Analog" if sensor["AN"] == "T" else "Digital"
-                    if "STA" in sensor:
-                        state_mapping = {"R": "Released", "A": "Armed", "D": "Disarmed"}
-                        attributes["State"] = state_mapping.get(sensor["STA"], sensor["STA"])
-                    if "BYP" in sensor:
-                        attributes["Bypass"] = "Active" if sensor["BYP"].upper() not in ["NO", "N"] else "Inactive"
-                    if "T" in sensor:
-                        attributes["Tamper"] = "Yes" if sensor["T"] == "T" else "No"
-                    if "A" in sensor:
-                        attributes["Alarm"] = "On" if sensor["A"] == "T" else "Off"
-                    if "FM" in sensor:
-                        attributes["Fault Memory"] = "Yes" if sensor["FM"] == "T" else "No"
-                    if "OHM" in sensor:
-                        attributes["Resistance"] = sensor["OHM"] if sensor["OHM"] != "NA" else "N/A"
-                    if "VAS" in sensor:
-                        attributes["Voltage Alarm Sensor"] = "Active" if sensor["VAS"] == "T" else "Inactive"
-                    if "LBL" in sensor and sensor["LBL"]:
-                        attributes["Label"] = sensor["LBL"]
-
-                    self._state = sensor.get("STA", "unknown")
-                    self._attributes = attributes
-                    break
-        elif self._sensor_type in ("door", "pmc", "zones", "imov", "window", "emov"):
-            return
-
-        else:
-            # For other sensors, we need to call getSensor with the specific type
-            sensors = await self.ws_manager.getSensor(self._sensor_type.upper())
-            for sensor in sensors:
-                if sensor["ID"] == self._id:
-                    self._state = sensor.get("STA", "unknown")
-                    self._attributes = sensor
-                    break
+        sensor = (await self.ws_manager.get_cached(cache_key)).get(str(self._id))
+        if sensor is not None:
+            self._apply_payload(sensor)
@@ -26,6 +26,8 @@ class WebSocketManager:
         self._pin = pin
         self._ws = None
         self.listeners = {"lights": [], "covers": [], "domus": [], "switches": [], "powerlines": [], "partitions": [], "zones": [], "systems": []}
+        # Listeners bound to a single entity, keyed by (entity type, ID)
+        self._entity_listeners = {}
         self._logger = logger
         self._running = False       # Flag to keep process alive
         self._loginId = None
@@ -36,6 +38,10 @@ class WebSocketManager:
         self._reconnect_lock = asyncio.Lock()
         self._command_queue = asyncio.Queue()  # Command queue
         self._pending_commands = {}
+        # Short-lived cache of sensor lists indexed by ID, shared by all entities
+        self._sensor_cache = {}
+        self._sensor_cache_ttl = 1.0
+        self._sensor_cache_inflight = {}  # Pending refresh per sensor type
 
         self._max_retries = 20
         self._retry_delay = 30
@@ -362,24 +368,50 @@ class WebSocketManager:
                 for callback in self.listeners.get("covers", []):
                     await callback(data["STATUS_OUTPUTS"])
             if "STATUS_BUS_HA_SENSORS" in data:
-                for callback in self.listeners.get("domus", []):
-                    await callback(data["STATUS_BUS_HA_SENSORS"])
+                self._update_realtime_data("STATUS_BUS_HA_SENSORS", data["STATUS_BUS_HA_SENSORS"], "DOMUS")
+                await self._notify_listeners("domus", data["STATUS_BUS_HA_SENSORS"])
             if "STATUS_POWER_LINES" in data:
-                for callback in self.listeners.get("powerlines", []):
-                    await callback(data["STATUS_POWER_LINES"])
+                self._update_realtime_data("STATUS_POWER_LINES", data["STATUS_POWER_LINES"], "POWER_LINES")
+                await self._notify_listeners("powerlines", data["STATUS_POWER_LINES"])
             if "STATUS_PARTITIONS" in data:
                 self._logger.debug(f"Updating state for partitions: {data['STATUS_PARTITIONS']}")
-                for callback in self.listeners.get("partitions", []):
-                    await callback(data["STATUS_PARTITIONS"])
+                self._update_realtime_data("STATUS_PARTITIONS", data["STATUS_PARTITIONS"], "PARTITIONS")
+                await self._notify_listeners("partitions", data["STATUS_PARTITIONS"])
             if "STATUS_ZONES" in data:
-                for callback in self.listeners.get("zones", []):
-                    await callback(data["STATUS_ZONES"])
+                self._update_realtime_data("STATUS_ZONES", data["STATUS_ZONES"], "ZONES")
+                await self._notify_listeners("zones", data["STATUS_ZONES"])
             if "STATUS_SYSTEM" in data:
-                for callback in self.listeners.get("systems", []):
-                    await callback(data["STATUS_SYSTEM"])
+                await self._notify_listeners("systems", data["STATUS_SYSTEM"])
 
 
 
+    """
+    Merges realtime sensor records into the stored realtime data.
+
+    Keeps the data read by getDom and getSensor current, record by record, so
+    that a refresh after a realtime update does not return the boot-time state.
+    The cached ID index of the sensor type is dropped.
+
+    Args:
+        status_key (str): key of the records in the realtime payload (e.g. "STATUS_ZONES")
+        records (list): realtime records received
+        cache_key (str): get_cached key of the same sensor type
+    """
+    def _update_realtime_data(self, status_key, records, cache_key):
+        if self._realtimeInitialData is None:
+            self._realtimeInitialData = {}
+        stored = self._realtimeInitialData.setdefault("PAYLOAD", {}).setdefault(status_key, [])
+        stored_by_id = self._index_by_id(stored)
+        for record in records:
+            existing = stored_by_id.get(record.get("ID"))
+            if existing is None:
+                existing = dict(record)
+                stored.append(existing)
+                stored_by_id[record.get("ID")] = existing
+            else:
+                existing.update(record)
+        self._sensor_cache.pop(cache_key, None)
+
     """
     Registers a listener for a specific entity type.
         
@@ -392,6 +424,51 @@ class WebSocketManager:
         if entity_type in self.listeners:
             self.listeners[entity_type].append(callback)
 
+    """
+    Registers a listener for a single entity of a specific type.
+
+    Unlike register_listener, the callback only receives the record matching
+    the entity ID, so a realtime frame is dispatched straight to the entities
+    it concerns instead of every entity scanning the whole list.
+
+    Args:
+        entity_type (str): entity type (e.g. "zones")
+        entity_id: ID of the entity
+        callback (function): function to call with the entity record
+    Returns:
+        function: callable removing the listener
+    """
+    def register_entity_listener(self, entity_type, entity_id, callback):
+        key = (entity_type, str(entity_id))
+        self._entity_listeners.setdefault(key, []).append(callback)
+
+        def remove_listener():
+            callbacks = self._entity_listeners.get(key, [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+            if not callbacks:
+                self._entity_listeners.pop(key, None)
+
+        return remove_listener
+
+    """
+    Notifies the listeners of an entity type with a list of realtime records.
+
+    Type-wide listeners receive the whole list, entity listeners only their own record.
+
+    Args:
+        entity_type (str): entity type (e.g. "zones")
+        data_list (list): realtime records received for that entity type
+    """
+    async def _notify_listeners(self, entity_type, data_list):
+        for callback in self.listeners.get(entity_type, []):
+            await callback(data_list)
+        if not self._entity_listeners:
+            return
+        for record in data_list:
+            for callback in list(self._entity_listeners.get((entity_type, str(record.get("ID"))), [])):
+                await callback(record)
+
     """ 
     Safely converts a value to an integer, returning a default if conversion fails.
     
@@ -408,6 +485,25 @@ class WebSocketManager:
         except (TypeError, ValueError):
             return default
 
+    """
+    Indexes a list of realtime records by their ID.
+
+    Lets the getters match static and realtime data with one lookup per item
+    instead of scanning the realtime list for every item. When an ID appears
+    more than once, the first record wins.
+
+    Args:
+        records (list): realtime records, each with an "ID" key.
+    Returns:
+        dict: records keyed by their ID.
+    """
+    @staticmethod
+    def _index_by_id(records):
+        index = {}
+        for record in records:
+            index.setdefault(record.get("ID"), record)
+        return index
+
 
     """
     Processes the command queue in a loop.
@@ -713,12 +809,12 @@ class WebSocketManager:
         if not self._realtimeInitialData or not self._readData:
             self._logger.error("Initial data not received in getLights")
             return []
-        lares_realtime = self._realtimeInitialData.get("PAYLOAD", {}).get("STATUS_OUTPUTS", [])
+        lares_realtime = self._index_by_id(self._realtimeInitialData.get("PAYLOAD", {}).get("STATUS_OUTPUTS", []))
         lights = [output for output in self._readData.get("OUTPUTS", []) if output.get("CAT") == "LIGHT"]
         lights_with_states = []
         for light in lights:
             light_id = light.get("ID")
-            state_data = next((state for state in lares_realtime if state.get("ID") == light_id), None)
+            state_data = lares_realtime.get(light_id)
             if state_data:
                 state_data["STA"] = state_data.get("STA", "off").lower()
                 state_data["POS"] = int(state_data.get("POS", 255))
@@ -742,13 +838,13 @@ class WebSocketManager:
         if not self._readData or not self._realtimeInitialData:
             self._logger.error("Initial data not received in getRolls")
             return []
-        lares_realtime = self._realtimeInitialData.get("PAYLOAD", {}).get("STATUS_OUTPUTS", [])
+        lares_realtime = self._index_by_id(self._realtimeInitialData.get("PAYLOAD", {}).get("STATUS_OUTPUTS", []))
         outputs = self._readData.get("OUTPUTS", [])
         rolls = [output for output in outputs if output.get("CAT") == "ROLL"]
         rolls_with_states = []
         for roll in rolls:
             roll_id = roll.get("ID")
-            state_data = next((state for state in lares_realtime if state.get("ID") == roll_id), None)
+            state_data = lares_realtime.get(roll_id)
             if state_data:
                 state_data["STA"] = state_data.get("STA", "off").lower()
                 pos_raw = state_data.get("POS")
@@ -772,12 +868,12 @@ class WebSocketManager:
         if not self._realtimeInitialData or not self._readData:
             self._logger.error("Initial data not received in getSwitches")
             return []
-        lares_realtime = self._realtimeInitialData.get("PAYLOAD", {}).get("STATUS_OUTPUTS", [])
+        lares_realtime = self._index_by_id(self._realtimeInitialData.get("PAYLOAD", {}).get("STATUS_OUTPUTS", []))
         switches = [output for output in self._readData.get("OUTPUTS", []) if output.get("CAT") != "LIGHT"]
         switches_with_states = []
         for switch in switches:
             switch_id = switch.get("ID")
-            state_data = next((state for state in lares_realtime if state.get("ID") == switch_id), None)
+            state_data = lares_realtime.get(switch_id)
             if state_data:
                 switches_with_states.append({**switch, **state_data})
         return switches_with_states
@@ -799,11 +895,11 @@ class WebSocketManager:
             self._logger.error("Initial data not received in getDom")
             return []
         domus = [output for output in self._readData.get("BUS_HAS", []) if output.get("TYP") == "DOMUS"]
-        lares_realtime = self._realtimeInitialData.get("PAYLOAD", {}).get("STATUS_BUS_HA_SENSORS", [])
+        lares_realtime = self._index_by_id(self._realtimeInitialData.get("PAYLOAD", {}).get("STATUS_BUS_HA_SENSORS", []))
         domus_with_states = []
         for sensor in domus:
             sensor_id = sensor.get("ID")
-            state_data = next((state for state in lares_realtime if state.get("ID") == sensor_id), None)
+            state_data = lares_realtime.get(sensor_id)
             if state_data:
                 domus_with_states.append({**sensor, **state_data})
         return domus_with_states
@@ -828,16 +924,62 @@ class WebSocketManager:
             self._logger.error("Initial data not received in getSensor")
             return []
         sensorList = self._readData.get(sName, [])
-        lares_realtime = self._realtimeInitialData.get("PAYLOAD", {}).get("STATUS_" + sName, [])
+        lares_realtime = self._index_by_id(self._realtimeInitialData.get("PAYLOAD", {}).get("STATUS_" + sName, []))
         sensor_with_states = []
         for sensor in sensorList:
             sensor_id = sensor.get("ID")
-            state_data = next((state for state in lares_realtime if state.get("ID") == sensor_id), None)
+            state_data = lares_realtime.get(sensor_id)
             if state_data:
                 sensor_with_states.append({**sensor, **state_data})
         return sensor_with_states
 
 
+    """
+    Retrieves the sensors of a specific type indexed by their ID.
+
+    The result is cached for a short time, so that all the entities of the
+    same type refreshing in the same poll cycle share a single lookup instead
+    of rebuilding and scanning the whole sensor list one by one. Concurrent
+    calls arriving while the cache is being refreshed await the same pending
+    refresh instead of starting their own.
+
+    :param sName: The sensor type to retrieve ("DOMUS", "SYSTEM" or any type accepted by getSensor).
+    :type sName: str
+    :return: Dictionary mapping the sensor ID (as string) to its data.
+    :rtype: dict
+    """
+    async def get_cached(self, sName):
+        cached = self._sensor_cache.get(sName)
+        if cached and time.monotonic() - cached[0] < self._sensor_cache_ttl:
+            return cached[1]
+        task = self._sensor_cache_inflight.get(sName)
+        if task is None:
+            task = asyncio.create_task(self._refresh_cached(sName))
+            self._sensor_cache_inflight[sName] = task
+            task.add_done_callback(lambda _: self._sensor_cache_inflight.pop(sName, None))
+        # Shielded so that a cancelled caller does not cancel the refresh awaited by the others
+        return await asyncio.shield(task)
+
+    """
+    Rebuilds the cached ID index for a specific sensor type.
+
+    :param sName: The sensor type to retrieve.
+    :type sName: str
+    :return: Dictionary mapping the sensor ID (as string) to its data.
+    :rtype: dict
+    """
+    async def _refresh_cached(self, sName):
+        if sName == "DOMUS":
+            sensors = await self.getDom()
+        elif sName == "SYSTEM":
+            sensors = await self.getSystem()
+        else:
+            sensors = await self.getSensor(sName)
+        by_id = {str(sensor.get("ID")): sensor for sensor in sensors}
+        self._sensor_cache[sName] = (time.monotonic(), by_id)
+        return by_id
+
+
     """
     Retrieves the list of scenarios available in the system.
 